@@ -0,0 +1,34 @@
+"""
+Gunicorn configuration for the port scanner web application
+
+Start the production server with:
+
+    gunicorn -c gunicorn.conf.py main:app
+
+Each worker runs gevent, so Supabase calls, exports and dashboard polling
+overlap inside a worker instead of queuing behind each other.
+"""
+
+import os
+
+# Step 1: Listen on all interfaces using the platform-provided port
+bind = f"0.0.0.0:{os.environ.get('PORT', 4000)}"
+
+# Step 2: Cooperative workers - one greenlet per request
+worker_class = 'gevent'
+worker_connections = int(os.environ.get('WORKER_CONNECTIONS', 1000))
+
+# Step 3: Worker processes
+# Running scans and export jobs live in the worker that started them, so more
+# than one worker needs REDIS_URL (shared completed scans) and sticky sessions.
+workers = int(os.environ.get('WEB_CONCURRENCY', 1))
+
+# Step 4: Keep long-lived SSE scan streams from being killed as hung workers
+timeout = int(os.environ.get('GUNICORN_TIMEOUT', 120))
+graceful_timeout = 30
+keepalive = 5
+
+# Step 5: Log to stdout/stderr so the hosting platform collects the output
+accesslog = '-'
+errorlog = '-'
+loglevel = os.environ.get('LOG_LEVEL', 'info').lower()
@@ -7,6 +7,14 @@ It uses Flask for the web interface and provides the ability to scan
 networks for open ports using multiple threads for better performance.
 """
 
+# Step 0: Patch blocking I/O (sockets, threads, ssl) for gevent
+# This must run before any other import so that Flask, httpx and the
+# Supabase client all pick up the cooperative versions.
+# The event loop is gevent's C libev loop by default; set GEVENT_LOOP=libuv
+# in the environment to run on the libuv-backed loop instead.
+from gevent import monkey
+monkey.patch_all()
+
 # Step 1: Load environment variables from .env file if available
 import os
 try:
@@ -16,21 +24,25 @@ except ImportError:
     print("python-dotenv not installed, skipping .env loading")
 
 # Step 2: Import the Flask app and setup functions from flask_web_interface module
-from scanner_tool.flask_web_interface import app, ensure_directories, create_templates, create_css, create_js
-
-# Step 3: Initialize required directories and files before app startup
-# This ensures all necessary file structure is in place
-ensure_directories()  # Create directory structure for the application
-create_templates()    # Generate HTML templates if they don't exist
-create_css()          # Generate CSS stylesheets if they don't exist
-create_js()           # Generate JavaScript files if they don't exist
+from scanner_tool.flask_web_interface import app, initialize_app
 
-# Step 4: Define the application entry point with Flask app run parameters
+# Step 3: Define the application entry point with Flask app run parameters
+# Under gunicorn (main:app) the one-time setup runs before the first request
 if __name__ == "__main__":
+    # Step 4: Initialize required directories and files before app startup
+    # This ensures all necessary file structure is in place
+    initialize_app()
+    
     # Step 5: Start the Flask web server
     # - host='0.0.0.0' makes the app accessible from any network interface
     # - port=4000 is the standard port for this application
     # - debug mode is determined by environment variable
     debug_mode = os.environ.get('FLASK_ENV') == 'development'
     port = int(os.environ.get('PORT', 4000))
-    app.run(host='0.0.0.0', port=port, debug=debug_mode)
+    if debug_mode:
+        # Werkzeug dev server with the reloader for local development
+        app.run(host='0.0.0.0', port=port, debug=debug_mode)
+    else:
+        # gevent WSGI server so blocking network calls overlap across requests
+        from gevent.pywsgi import WSGIServer
+        WSGIServer(('0.0.0.0', port), app).serve_forever()
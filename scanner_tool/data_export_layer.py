@@ -3,50 +3,81 @@ Data Export Layer - Handles exporting scan results to different formats
 """
 
 import os
+import io
 import logging
 import csv
-import json
+import itertools
 import re
-from typing import Dict, List, Optional, Any, cast
+import tempfile
+import threading
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, Optional, Any, Iterator, cast
 from datetime import datetime
+from xml.sax.saxutils import escape
 
 # Import third-party libraries for specific file formats
 try:
-    import openpyxl
-    import openpyxl.styles
-    from openpyxl import Workbook
-    from openpyxl.worksheet.worksheet import Worksheet
+    import xlsxwriter
     EXCEL_AVAILABLE = True
-    # Type hints for proper type checking
-    from typing import TYPE_CHECKING
-    if TYPE_CHECKING:
-        from openpyxl.workbook.workbook import Workbook as WorkbookType
-        from openpyxl.worksheet.worksheet import Worksheet as WorksheetType
 except ImportError:
-    openpyxl = None
-    Workbook = None
-    Worksheet = None
+    xlsxwriter = None
     EXCEL_AVAILABLE = False
 
 try:
-    from fpdf import FPDF
+    from reportlab.lib import colors
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
     PDF_AVAILABLE = True
 except ImportError:
-    FPDF = None
+    SimpleDocTemplate = None
     PDF_AVAILABLE = False
 
+import orjson
+from cachetools import TTLCache
 from colorama import Fore
 
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns used on every export
+_FILENAME_SANITIZE_RE = re.compile(r'[^\w\-_.]')
+_BANNER_NEWLINES = re.compile(r'\r\n|[\r\n]')
+# PDF cell cleanup: newlines become spaces, and any byte outside ASCII
+# becomes '?' (the PDF base fonts only cover ASCII reliably)
+_PDF_NEWLINES = str.maketrans('\r\n', '  ')
+_ASCII_REPLACE = bytes(c if c < 128 else ord('?') for c in range(256))
+
+# SSL certificate fields shown in the export, in display order
+_SSL_LABELS = (
+    ("Issued To", "issued_to"),
+    ("Issued By", "issued_by"),
+    ("Valid From", "valid_from"),
+    ("Valid Until", "valid_until"),
+    ("Version", "version"),
+)
+
 class DataExportLayer:
     """
     Handles exporting scan results to various formats (Excel, CSV, PDF, JSON).
+
+    Use the shared module-level ``export_layer`` instance rather than creating
+    one per request. It is safe to share between threads: the export job
+    table is guarded by a lock, and the only other mutable state is the
+    export-directory-verified flag.
     """
 
     def __init__(self):
         """Initialize the data export layer."""
         self.export_dir = "scan_results"
+        # Set once ensure_export_directory() has verified the directory
+        self._export_dir_verified = False
+        # Background writers for exports submitted with submit_export(), and the
+        # pending/finished jobs as (owner, future) keyed by job ID (kept for an
+        # hour for polling)
+        self._export_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='export')
+        self._export_jobs: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+        self._export_jobs_lock = threading.Lock()
 
         # Create export directory if it doesn't exist
         if not os.path.exists(self.export_dir):
@@ -57,22 +88,23 @@ class DataExportLayer:
                 # Fallback to current directory
                 self.export_dir = ""
 
-    def _prepare_data(self, scan_results: Dict[int, Dict], host: str) -> List[List[str]]:
+    def _iter_rows(self, scan_results: Dict[int, Dict], host: str, scan_time: str) -> Iterator[List[str]]:
         """
-        Prepare scan data for export.
+        Yield scan data rows for export, header row first.
+
+        Rows are produced one at a time so large scans never have to be
+        materialized as a full list of lists.
 
         Args:
             scan_results: Dictionary of open ports and their data including service and banner info
             host: The hostname or IP address scanned
+            scan_time: Formatted export timestamp for the "Scan Date" column
 
-        Returns:
-            List[List[str]]: List of rows for export
+        Yields:
+            List[str]: The header row, then one row per open port
         """
         # Create header row
-        data = [["Host", "Port", "Status", "Service", "Version", "Server", "Banner", "SSL Certificate", "Scan Date"]]
-
-        # Add scan timestamp
-        scan_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        yield ["Host", "Port", "Status", "Service", "Version", "Server", "Banner", "SSL Certificate", "Scan Date"]
 
         # Add data rows
         for port, port_data in scan_results.items():
@@ -82,7 +114,7 @@ class DataExportLayer:
             banner = port_data.get("banner", "")
 
             # Clean and truncate long banners
-            banner = banner.replace('\r\n', ' | ').replace('\n', ' | ').replace('\r', ' | ')
+            banner = _BANNER_NEWLINES.sub(' | ', banner)
             if len(banner) > 500:
                 banner = banner[:497] + "..."
 
@@ -90,21 +122,9 @@ class DataExportLayer:
             ssl_cert = port_data.get("ssl_cert", {})
             ssl_info = ""
             if ssl_cert and isinstance(ssl_cert, dict) and any(ssl_cert.values()):
-                cert_details = []
-                if ssl_cert.get("issued_to"):
-                    cert_details.append(f"Issued To: {ssl_cert['issued_to']}")
-                if ssl_cert.get("issued_by"):
-                    cert_details.append(f"Issued By: {ssl_cert['issued_by']}")
-                if ssl_cert.get("valid_from"):
-                    cert_details.append(f"Valid From: {ssl_cert['valid_from']}")
-                if ssl_cert.get("valid_until"):
-                    cert_details.append(f"Valid Until: {ssl_cert['valid_until']}")
-                if ssl_cert.get("version"):
-                    cert_details.append(f"Version: {ssl_cert['version']}")
-
-                ssl_info = ", ".join(cert_details)
-
-            data.append([
+                ssl_info = ", ".join(f"{label}: {ssl_cert[key]}" for label, key in _SSL_LABELS if ssl_cert.get(key))
+
+            yield [
                 host, 
                 str(port), 
                 "Open", 
@@ -114,9 +134,59 @@ class DataExportLayer:
                 banner, 
                 ssl_info, 
                 scan_time
-            ])
+            ]
+
+    def submit_export(self, format_type: str, scan_results: Dict[int, Dict], host: str, filename: Optional[str] = None,
+                      owner: Optional[object] = None) -> str:
+        """
+        Run an export in the background and return a job ID to poll.
+
+        Args:
+            format_type: One of 'csv', 'excel', 'pdf' or 'json'
+            scan_results: Dictionary of open ports and their detailed information
+            host: The hostname or IP address scanned
+            filename: Optional filename for the export
+            owner: Who requested the export (e.g. a user ID); only the same
+                owner can look the job up again
 
-        return data
+        Returns:
+            str: Job ID to pass to get_export_job()
+
+        Raises:
+            ValueError: If the format is not supported
+        """
+        export_funcs = {
+            'csv': self.export_to_csv,
+            'excel': self.export_to_excel,
+            'pdf': self.export_to_pdf,
+            'json': self.export_to_json,
+        }
+        if format_type not in export_funcs:
+            raise ValueError(f"Unsupported export format: {format_type}")
+
+        job_id = uuid.uuid4().hex
+        future = self._export_executor.submit(export_funcs[format_type], scan_results, host, filename)
+        with self._export_jobs_lock:
+            self._export_jobs[job_id] = (owner, future)
+        return job_id
+
+    def get_export_job(self, job_id: str, owner: Optional[object] = None) -> Optional[Future]:
+        """
+        Look up a background export submitted with submit_export().
+
+        Args:
+            job_id: The job ID returned by submit_export()
+            owner: The owner the job was submitted with
+
+        Returns:
+            Optional[Future]: The job's future (its result is the file path), or None if
+                unknown/expired or submitted by a different owner
+        """
+        with self._export_jobs_lock:
+            job = self._export_jobs.get(job_id)
+        if job is None or job[0] != owner:
+            return None
+        return job[1]
 
     def export_to_csv(self, scan_results: Dict[int, Dict], host: str, filename: Optional[str] = None) -> str:
         """
@@ -131,20 +201,24 @@ class DataExportLayer:
             str: Path to the exported file
         """
         try:
+            # Take one timestamp for the filename and the rows
+            now = datetime.now()
+
             # Generate filename if not provided
             if filename is None:
-                filename = f"{host}_scan_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+                filename = f"{host}_scan_{now.strftime('%Y%m%d_%H%M%S')}.csv"
 
             # Create full path
             filepath = os.path.join(self.export_dir, filename)
 
             # Prepare data
-            data = self._prepare_data(scan_results, host)
+            rows = self._iter_rows(scan_results, host, now.strftime('%Y-%m-%d %H:%M:%S'))
 
-            # Write to CSV
+            # Write to CSV, streaming rows straight from the generator
             with open(filepath, 'w', newline='', encoding='utf-8') as csvfile:
                 writer = csv.writer(csvfile)
-                writer.writerows(data)
+                writer.writerow(next(rows))
+                writer.writerows(rows)
 
             logger.info(f"Scan results exported to CSV: {filepath}")
             return filepath
@@ -154,6 +228,78 @@ class DataExportLayer:
             print(f"{Fore.RED}[ERROR] Failed to export to CSV: {e}")
             return ""
 
+    def stream_csv(self, scan_results: Dict[int, Dict], host: str, chunk_rows: int = 4096,
+                   save_to: Optional[str] = None) -> Iterator[bytes]:
+        """
+        Export scan results to CSV as a stream of UTF-8 chunks.
+
+        Rows are formatted into an in-memory buffer and handed out
+        `chunk_rows` at a time, so a web response can send them as they are
+        produced. With `save_to`, each chunk is also written to a temporary
+        file that is renamed to `save_to` once the last chunk is out; if the
+        stream is abandoned part-way the partial file is removed. A file that
+        can't be written is logged and the stream carries on without it.
+
+        Args:
+            scan_results: Dictionary of open ports and their detailed information
+            host: The hostname or IP address scanned
+            chunk_rows: Number of rows per chunk
+            save_to: Optional path to keep a copy of the CSV at
+
+        Yields:
+            bytes: The CSV, header row first, in the same layout as export_to_csv
+        """
+        rows = self._iter_rows(scan_results, host, datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        # csv.writer still does the quoting (banners contain commas and quotes),
+        # but into one buffer per chunk instead of a write per row
+        buf = io.StringIO(newline='')
+        writer = csv.writer(buf)
+
+        copy = tmp_path = None  # Open copy of the stream and its temporary path
+        if save_to:
+            try:
+                self.ensure_export_directory()
+                fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(save_to) or '.', prefix='.tmp-', suffix='.csv')
+                copy = os.fdopen(fd, 'wb')
+            except OSError as e:
+                logger.warning("Not keeping a copy of the CSV export at %s: %s", save_to, e)
+                tmp_path = None
+
+        try:
+            while True:
+                writer.writerows(itertools.islice(rows, chunk_rows))
+                chunk = buf.getvalue()
+                if not chunk:
+                    break
+                buf.seek(0)
+                buf.truncate()
+                data = chunk.encode('utf-8')
+                if copy is not None:
+                    try:
+                        copy.write(data)
+                    except OSError as e:
+                        # e.g. disk full: keep streaming, just without the copy
+                        logger.warning("Not keeping a copy of the CSV export at %s: %s", save_to, e)
+                        copy.close()
+                        copy = None
+                yield data
+            if copy is not None:
+                try:
+                    copy.close()
+                    os.replace(tmp_path, save_to)
+                    tmp_path = None
+                except OSError as e:
+                    logger.warning("Not keeping a copy of the CSV export at %s: %s", save_to, e)
+        finally:
+            # Abandoned (client went away) or failed: drop the partial copy
+            if copy is not None and not copy.closed:
+                copy.close()
+            if tmp_path is not None:
+                try:
+                    os.unlink(tmp_path)
+                except OSError:
+                    pass
+
     def validate_filename(self, filename: str) -> str:
         """
         Validate and sanitize the export filename.
@@ -174,7 +320,7 @@ class DataExportLayer:
         filename = os.path.basename(filename)
         
         # Remove any potentially dangerous characters
-        filename = re.sub(r'[^\w\-_\.]', '_', filename)
+        filename = _FILENAME_SANITIZE_RE.sub('_', filename)
         
         # Ensure the filename has an extension
         if not os.path.splitext(filename)[1]:
@@ -186,21 +332,25 @@ class DataExportLayer:
         """
         Ensure the export directory exists and is writable.
         
+        The check runs once per instance; after it succeeds it is skipped
+        until a write into the directory fails again.
+        
         Raises:
             OSError: If directory cannot be created or is not writable
         """
+        if self._export_dir_verified:
+            return
+        
         try:
             os.makedirs(self.export_dir, exist_ok=True)
-            # Test if directory is writable
-            test_file = os.path.join(self.export_dir, '.test')
-            try:
-                with open(test_file, 'w') as f:
-                    f.write('test')
-                os.remove(test_file)
-            except (IOError, OSError) as e:
-                raise OSError(f"Export directory is not writable: {e}")
         except OSError as e:
             raise OSError(f"Cannot create export directory: {e}")
+        
+        # Test if directory is writable
+        if not os.access(self.export_dir, os.W_OK):
+            raise OSError(f"Export directory is not writable: {self.export_dir}")
+        
+        self._export_dir_verified = True
 
     def export_to_excel(self, scan_results: Dict[int, Dict], host: str, filename: Optional[str] = None) -> str:
         """
@@ -218,8 +368,8 @@ class DataExportLayer:
             ValueError: If input parameters are invalid
             OSError: If file operations fail
         """
-        if not EXCEL_AVAILABLE or openpyxl is None:
-            raise ImportError("Excel export not available. Please install openpyxl package.")
+        if not EXCEL_AVAILABLE or xlsxwriter is None:
+            raise ImportError("Excel export not available. Please install xlsxwriter package.")
         
         if not scan_results:
             raise ValueError("No scan results to export")
@@ -240,55 +390,59 @@ class DataExportLayer:
             
             # Check if file already exists
             if os.path.exists(filepath):
-                backup_count = 1
-                while os.path.exists(f"{filepath}.{backup_count}"):
-                    backup_count += 1
-                filepath = f"{filepath}.{backup_count}"
+                # List the directory once and pick the next free backup suffix
+                prefix = filename + '.'
+                suffixes = [0]
+                with os.scandir(self.export_dir or '.') as entries:
+                    for entry in entries:
+                        if entry.name.startswith(prefix):
+                            suffix = entry.name[len(prefix):]
+                            if suffix.isdigit():
+                                suffixes.append(int(suffix))
+                filepath = f"{filepath}.{max(suffixes) + 1}"
             
             # Create workbook and add data
-            wb = openpyxl.Workbook()
-            ws = wb.active
-            ws.title = "Scan Results"
+            # constant_memory streams each row to disk as soon as it is written
+            wb = xlsxwriter.Workbook(filepath, {'constant_memory': True})
+            ws = wb.add_worksheet("Scan Results")
             
             # Add headers
             headers = ["Port", "Status", "Service", "Banner", "SSL Info"]
-            for col, header in enumerate(headers, 1):
-                ws.cell(row=1, column=col, value=header)
+            ws.write_row(0, 0, headers)
+            
+            # Track column widths while writing instead of re-scanning the sheet
+            max_widths = [len(header) for header in headers]
             
             # Add data
-            for row, (port, info) in enumerate(scan_results.items(), 2):
-                ws.cell(row=row, column=1, value=port)
-                ws.cell(row=row, column=2, value="Open")
-                ws.cell(row=row, column=3, value=info.get('service', ''))
-                ws.cell(row=row, column=4, value=info.get('banner', ''))
-                
+            for row, (port, info) in enumerate(scan_results.items(), 1):
                 # Format SSL info if available
                 ssl_info = info.get('ssl_cert', {})
+                ssl_text = ""
                 if ssl_info:
                     ssl_text = f"Issued to: {ssl_info.get('issued_to', 'Unknown')}\n"
                     ssl_text += f"Issued by: {ssl_info.get('issued_by', 'Unknown')}\n"
                     ssl_text += f"Valid from: {ssl_info.get('valid_from', '')}\n"
                     ssl_text += f"Valid until: {ssl_info.get('valid_until', '')}"
-                    ws.cell(row=row, column=5, value=ssl_text)
+                
+                values = (port, "Open", info.get('service', ''), info.get('banner', ''), ssl_text)
+                ws.write_row(row, 0, values)
+                for col, value in enumerate(values):
+                    width = len(str(value))
+                    if width > max_widths[col]:
+                        max_widths[col] = width
             
             # Auto-adjust column widths
-            for column in ws.columns:
-                max_length = 0
-                column = list(column)
-                for cell in column:
-                    try:
-                        if len(str(cell.value)) > max_length:
-                            max_length = len(str(cell.value))
-                    except:
-                        pass
-                adjusted_width = (max_length + 2)
-                ws.column_dimensions[column[0].column_letter].width = adjusted_width
+            for col, width in enumerate(max_widths):
+                ws.set_column(col, col, width + 2)
             
             # Save workbook
-            wb.save(filepath)
+            wb.close()
             return filepath
             
         except Exception as e:
+            if isinstance(e, OSError):
+                # The directory may have gone away; verify it again next time
+                self._export_dir_verified = False
             raise OSError(f"Failed to export to Excel: {str(e)}")
 
     def export_to_pdf(self, scan_results: Dict[int, Dict], host: str, filename: Optional[str] = None) -> str:
@@ -303,72 +457,67 @@ class DataExportLayer:
         Returns:
             str: Path to the exported file
         """
-        if not PDF_AVAILABLE or FPDF is None:
-            logger.warning("PDF export not available. Install fpdf package.")
-            print(f"{Fore.YELLOW}[WARNING] PDF export not available. Install 'fpdf' package.")
+        if not PDF_AVAILABLE or SimpleDocTemplate is None:
+            logger.warning("PDF export not available. Install reportlab package.")
+            print(f"{Fore.YELLOW}[WARNING] PDF export not available. Install 'reportlab' package.")
             return ""
 
         try:
             # Ensure the export directory exists
             os.makedirs(self.export_dir, exist_ok=True)
+            # Take one timestamp for the filename, the rows and the title
+            now = datetime.now()
+            scan_date = now.strftime('%Y-%m-%d %H:%M:%S')
+
             # Generate filename if not provided
             if filename is None:
-                filename = f"{host}_scan_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+                filename = f"{host}_scan_{now.strftime('%Y%m%d_%H%M%S')}.pdf"
 
             # Create full path
             filepath = os.path.join(self.export_dir, filename)
 
             # Prepare data
-            data = self._prepare_data(scan_results, host)
-
-            # Create PDF object
-            pdf = FPDF()
-            pdf.add_page()
-
-            # Set font
-            pdf.set_font("Arial", size=12)
-
-            # Add title
-            pdf.set_font("Arial", 'B', 16)
-            pdf.cell(200, 10, f"Port Scan Results for {host}", ln=True, align='C')
-
-            # Add scan timestamp
-            pdf.set_font("Arial", size=10)
-            pdf.cell(200, 10, f"Scan Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", ln=True)
-
-            # Add some space
-            pdf.ln(10)
+            rows = self._iter_rows(scan_results, host, scan_date)
+            header = next(rows)
 
             # Select limited columns for PDF display
             # PDF has limited width, so we'll only include key information
             pdf_headers = ["Host", "Port", "Status", "Service", "Version", "Server"]
-            pdf_column_indices = [data[0].index(header) for header in pdf_headers if header in data[0]]
-
-            # Set table header
-            pdf.set_font("Arial", 'B', 12)
-            col_width = min(190 / len(pdf_column_indices), 36)
-            row_height = 10
+            pdf_column_indices = [header.index(name) for name in pdf_headers if name in header]
 
-            # Add header row
-            for idx in pdf_column_indices:
-                pdf.cell(col_width, row_height, data[0][idx], border=1)
-            pdf.ln(row_height)
-
-            # Add data rows
-            pdf.set_font("Arial", size=8)
-            for row in data[1:]:
+            # Build the table rows
+            table_rows = [[header[idx] for idx in pdf_column_indices]]
+            for row in rows:
+                cells = []
                 for idx in pdf_column_indices:
                     # Truncate and clean text for PDF
-                    text = str(row[idx]).replace('\r\n', ' ').replace('\n', ' ').replace('\r', ' ')
+                    text = str(row[idx]).translate(_PDF_NEWLINES)
                     # Remove non-ASCII characters that might cause PDF issues
-                    text = ''.join(char if ord(char) < 128 else '?' for char in text)
+                    text = text.encode('latin-1', 'replace').translate(_ASCII_REPLACE).decode('ascii')
                     if len(text) > 40:
                         text = text[:37] + "..."
-                    pdf.cell(col_width, row_height, text, border=1)
-                pdf.ln(row_height)
-
-            # Save the PDF
-            pdf.output(filepath)
+                    cells.append(text)
+                table_rows.append(cells)
+
+            # Lay out the whole table in one flowable; the header repeats on every page
+            table = Table(table_rows, repeatRows=1)
+            table.setStyle(TableStyle([
+                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+                ('FONTSIZE', (0, 0), (-1, 0), 12),
+                ('FONTSIZE', (0, 1), (-1, -1), 8),
+                ('GRID', (0, 0), (-1, -1), 0.5, colors.black),
+                ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ]))
+
+            # Title, scan timestamp and table
+            styles = getSampleStyleSheet()
+            doc = SimpleDocTemplate(filepath, pagesize=A4)
+            doc.build([
+                Paragraph(escape(f"Port Scan Results for {host}"), styles['Title']),
+                Paragraph(f"Scan Date: {scan_date}", styles['Normal']),
+                Spacer(1, 12),
+                table,
+            ])
 
             logger.info(f"Scan results exported to PDF: {filepath}")
             return filepath
@@ -391,26 +540,37 @@ class DataExportLayer:
             str: Path to the exported file
         """
         try:
+            # Take one timestamp for the filename and the scan info
+            now = datetime.now()
+
             # Generate filename if not provided
             if filename is None:
-                filename = f"{host}_scan_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+                filename = f"{host}_scan_{now.strftime('%Y%m%d_%H%M%S')}.json"
 
             # Create full path
             filepath = os.path.join(self.export_dir, filename)
 
             # Create export data structure
-            export_data = {
-                "scan_info": {
-                    "host": host,
-                    "scan_date": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                    "total_open_ports": len(scan_results)
-                },
-                "open_ports": scan_results
+            scan_info = {
+                "host": host,
+                "scan_date": now.strftime('%Y-%m-%d %H:%M:%S'),
+                "total_open_ports": len(scan_results)
             }
 
-            # Write to JSON file
-            with open(filepath, 'w', encoding='utf-8') as jsonfile:
-                json.dump(export_data, jsonfile, indent=2, default=str, ensure_ascii=False)
+            # Write to JSON file one port at a time instead of serializing the
+            # whole document into a single buffer first; orjson encodes each
+            # piece straight to bytes
+            with open(filepath, 'wb') as jsonfile:
+                jsonfile.write(b'{"scan_info": ')
+                jsonfile.write(orjson.dumps(scan_info, default=str))
+                jsonfile.write(b', "open_ports": {')
+                first = True
+                for port, port_data in scan_results.items():
+                    if not first:
+                        jsonfile.write(b', ')
+                    first = False
+                    jsonfile.write(orjson.dumps(str(port)) + b': ' + orjson.dumps(port_data, default=str))
+                jsonfile.write(b'}}')
 
             logger.info(f"Scan results exported to JSON: {filepath}")
             return filepath
@@ -418,4 +578,8 @@ class DataExportLayer:
         except Exception as e:
             logger.error(f"Error exporting to JSON: {e}")
             print(f"{Fore.RED}[ERROR] Failed to export to JSON: {e}")
-            return ""
\ No newline at end of file
+            return ""
+
+
+# Shared instance used by the web interface and the CLI
+export_layer = DataExportLayer()
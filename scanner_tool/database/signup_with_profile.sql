@@ -0,0 +1,22 @@
+-- Creates the public.users profile row for a new account in one round-trip.
+-- Checks username uniqueness and inserts inside a single transaction, so the
+-- signup route no longer needs a separate lookup query.
+create or replace function public.signup_with_profile(p_username text, p_email text)
+returns bigint
+language plpgsql
+as $$
+declare
+    new_id bigint;
+begin
+    if exists (select 1 from public.users where username = p_username) then
+        raise exception 'Username already exists' using errcode = 'unique_violation';
+    end if;
+
+    -- Password is managed by Supabase Auth; the column is NOT NULL
+    insert into public.users (username, email, password)
+    values (p_username, p_email, 'managed-by-supabase-auth')
+    returning id into new_id;
+
+    return new_id;
+end;
+$$;
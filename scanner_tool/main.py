@@ -10,13 +10,15 @@ import socket
 import argparse
 import logging
 import platform
+import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import List, Dict, Union, Tuple
 
 # Import local modules
 from scanner_engine import ScannerEngine
 from threading_module import ThreadingModule
-from data_export_layer import DataExportLayer
+from data_export_layer import export_layer
 
 # Import third-party libraries for terminal display
 import colorama
@@ -42,6 +44,8 @@ logger = logging.getLogger(__name__)
 # Constants
 DEFAULT_PORTS = [21, 22, 23, 25, 53, 80, 110, 123, 135, 139, 143, 389, 443, 445, 993, 995, 1723, 3306, 3389, 5900, 8080]
 VERSION = "1.0.0"
+DNS_CACHE_TTL = 300   # Seconds a resolved address is reused
+DNS_CACHE_SIZE = 128  # Most hosts kept in the resolver cache
 BANNER = f"""
 {Fore.BLUE}╔══════════════════════════════════════════════════════════╗
 ║  {Fore.RED}▄▄▄▄▄▄▄▄▄▄▄  {Fore.GREEN}▄▄▄▄▄▄▄▄▄▄▄  {Fore.BLUE}▄▄       ▄▄  {Fore.YELLOW}▄▄▄▄▄▄▄▄▄▄▄   {Fore.BLUE}║
@@ -75,6 +79,37 @@ BANNER = f"""
 {Fore.CYAN}Discover network services with precision.
 """
 
+# host -> (ip address, expiry on the monotonic clock), least recently used first
+_dns_cache: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+
+def resolve_host(host: str) -> str:
+    """
+    Resolve a hostname to an IPv4 address, reusing recent answers so
+    validating and then scanning a host (or scanning it again) costs one
+    lookup.
+    
+    Args:
+        host: The hostname or IP address to resolve
+        
+    Returns:
+        str: The IPv4 address
+        
+    Raises:
+        socket.gaierror: If the host cannot be resolved
+    """
+    now = time.monotonic()
+    entry = _dns_cache.get(host)
+    if entry is not None and entry[1] > now:
+        _dns_cache.move_to_end(host)
+        return entry[0]
+    
+    ip_address = socket.gethostbyname(host)
+    _dns_cache[host] = (ip_address, now + DNS_CACHE_TTL)
+    _dns_cache.move_to_end(host)
+    if len(_dns_cache) > DNS_CACHE_SIZE:
+        _dns_cache.popitem(last=False)
+    return ip_address
+
 class PortScanner:
     """Main port scanner class that orchestrates the scanning process."""
     
@@ -82,7 +117,7 @@ class PortScanner:
         """Initialize the port scanner with its components."""
         self.scanner_engine = ScannerEngine()
         self.threading_module = ThreadingModule()
-        self.data_export = DataExportLayer()
+        self.data_export = export_layer
         self.console = Console()
         
     def validate_host(self, host: str) -> bool:
@@ -96,7 +131,7 @@ class PortScanner:
             bool: True if host is valid, False otherwise
         """
         try:
-            socket.gethostbyname(host)
+            resolve_host(host)
             return True
         except socket.gaierror:
             return False
@@ -219,7 +254,7 @@ class PortScanner:
             return
         
         try:
-            ip_address = socket.gethostbyname(host)
+            ip_address = resolve_host(host)
             print(f"{Fore.CYAN}[INFO] Scanning target: {host} ({ip_address})")
             
             start_time = datetime.now()
@@ -443,6 +443,7 @@ It is responsible for testing if ports are open and identifying service informat
 
 # Step 1: Import necessary modules
 import socket          # For creating network connections to test ports
+import asyncio         # For sweeping many ports concurrently without threads
 import logging         # For logging scan progress and errors
 from typing import List, Dict, Callable, Optional, Tuple, TYPE_CHECKING, Any  # Type hints
 import time            # For timing operations
@@ -450,6 +451,8 @@ import random          # For randomizing port scan order to avoid detection
 import ssl             # For SSL/TLS certificate grabbing
 import re              # For parsing banner responses
 import struct          # For handling binary data in protocol responses
+import os              # For the CPU count
+from functools import lru_cache  # For memoizing service name lookups
 
 from colorama import Fore  # For colored terminal output
 
@@ -460,6 +463,9 @@ if TYPE_CHECKING:
 # Step 3: Configure logging
 logger = logging.getLogger(__name__)
 
+# Number of CPU cores, read once at import (only used for logging)
+CPU_COUNT = os.cpu_count() or 1
+
 # Step 4: Define common service to port mappings dictionary
 # This provides a quick lookup for common services without relying on socket.getservbyport()
 SERVICE_MAP = {
@@ -507,6 +513,32 @@ SERVICE_MAP = {
     8080: "HTTP-Proxy"
 }
 
+@lru_cache(maxsize=None)
+def lookup_service(port: int) -> str:
+    """
+    Service name for a port number, memoized for the life of the process.
+    
+    socket.getservbyport reads the system services database on every call;
+    the answer for a port never changes, so each port is looked up once.
+    There are at most 65536 ports, so the cache is bounded.
+    
+    Args:
+        port: The port number
+        
+    Returns:
+        str: The service name associated with the port, or "Unknown"
+    """
+    try:
+        # First check our own map for common services (faster)
+        if port in SERVICE_MAP:
+            return SERVICE_MAP[port]
+            
+        # Then try socket.getservbyport for less common services
+        return socket.getservbyport(port)
+    except (socket.error, OSError):
+        # Return "Unknown" if service can't be identified
+        return "Unknown"
+
 class ScannerEngine:
     """
     Core scanning engine that handles port scanning and service identification.
@@ -565,16 +597,8 @@ class ScannerEngine:
         Returns:
             str: The service name associated with the port
         """
-        try:
-            # Step 7.1: First check our own map for common services (faster)
-            if port in SERVICE_MAP:
-                return SERVICE_MAP[port]
-                
-            # Step 7.2: Then try socket.getservbyport for less common services
-            return socket.getservbyport(port)
-        except (socket.error, OSError):
-            # Return "Unknown" if service can't be identified
-            return "Unknown"
+        # Step 7.1: Look up the (memoized) service name for the port
+        return lookup_service(port)
     
     def grab_banner(self, host: str, port: int, service: str) -> Dict[str, Any]:
         """
@@ -834,7 +858,7 @@ class ScannerEngine:
         
         return ssl_info
     
-    def scan_port_worker(self, host: str, port: int, progress_callback: Optional[Callable] = None) -> Tuple[int, bool, str, Dict[str, Any]]:
+    def scan_port_worker(self, host: str, port: int, progress_callback: Optional[Callable] = None, is_open: Optional[bool] = None, address: Optional[str] = None) -> Tuple[int, bool, str, Dict[str, Any]]:
         """
         Step 8: Worker function that scans a single port.
         This is the function that will be executed by each thread.
@@ -843,12 +867,15 @@ class ScannerEngine:
             host: The hostname or IP address to scan
             port: The port number to scan
             progress_callback: Optional callback function to update progress
+            is_open: Known open status (from sweep_ports), skips the connect test
+            address: Pre-resolved IP for the connect test; banners still use host
             
         Returns:
             Tuple[int, bool, str, Dict[str, Any]]: Port number, open status, service name, and banner information
         """
         # Step 8.1: Test if port is open
-        is_open = self.test_port(host, port)
+        if is_open is None:
+            is_open = self.test_port(address or host, port)
         
         # Step 8.2: Get service info if port is open
         service = self.fetch_service_info(port) if is_open else ""
@@ -871,13 +898,101 @@ class ScannerEngine:
         # Step 8.6: Return results tuple for this port
         return port, is_open, service, banner_info
     
+    def _probe_port(self, address: str, port: int, on_closed: Optional[Callable]) -> Optional[int]:
+        """
+        Connect-test one port with a blocking socket, for sweeps run on
+        greenlets (see scan_ports).
+        
+        Args:
+            address: IPv4 address to scan
+            port: Port number to test
+            on_closed: Optional callback(port, False) if the port is closed
+            
+        Returns:
+            Optional[int]: The port if it accepted a connection, otherwise None
+        """
+        if self.test_port(address, port):
+            return port
+        if on_closed:
+            on_closed(port, False)
+        return None
+    
+    async def _probe_ports(self, address: str, ports: List[int], concurrency: int, on_closed: Optional[Callable], stop_event) -> List[int]:
+        """
+        Connect-test ports from a fixed number of coroutines on one event loop.
+        
+        Args:
+            address: IPv4 address to scan
+            ports: Port numbers to test
+            concurrency: Number of connection attempts kept in flight
+            on_closed: Optional callback(port, False) for each closed port
+            stop_event: threading.Event that ends the sweep early when set
+            
+        Returns:
+            List[int]: The ports that accepted a connection
+        """
+        loop = asyncio.get_running_loop()
+        pending = iter(ports)
+        open_ports = []
+        
+        async def worker():
+            # Each worker pulls the next port, so at most `concurrency` sockets are open
+            for port in pending:
+                if stop_event is not None and stop_event.is_set():
+                    return
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.setblocking(False)
+                try:
+                    await asyncio.wait_for(loop.sock_connect(sock, (address, port)), self.timeout)
+                    open_ports.append(port)
+                    continue
+                except (asyncio.TimeoutError, OSError):
+                    pass
+                finally:
+                    sock.close()
+                if on_closed:
+                    on_closed(port, False)
+        
+        await asyncio.gather(*(worker() for _ in range(min(concurrency, len(ports)))))
+        return open_ports
+    
+    def sweep_ports(self, host: str, ports: List[int], concurrency: int, on_closed: Optional[Callable] = None, stop_event=None, address: Optional[str] = None) -> List[int]:
+        """
+        Find the open ports on a host with asynchronous connects.
+        A TCP connect scan spends nearly all its time waiting on the network,
+        so one event loop with many sockets in flight replaces a thread per
+        probe. Banner grabbing for the (few) open ports is left to the caller.
+        
+        Used when threads are real OS threads (the terminal scanner). Under
+        gevent (the web app, see main.py) scan_ports runs the same bounded
+        sweep on greenlets with _probe_port instead of an asyncio loop.
+        
+        Args:
+            host: The hostname or IP address to scan
+            ports: Port numbers to test
+            concurrency: Number of connection attempts kept in flight
+            on_closed: Optional callback(port, False) for each closed port
+            stop_event: Optional threading.Event that ends the sweep early
+            address: Pre-resolved IP of host, if the caller already has one
+            
+        Returns:
+            List[int]: The ports that accepted a connection
+        """
+        if not ports:
+            return []
+        # Resolve once instead of on every connect
+        if address is None:
+            address = socket.gethostbyname(host)
+        return asyncio.run(self._probe_ports(address, ports, concurrency, on_closed, stop_event))
+    
     def scan_ports(
         self, 
         host: str, 
         ports: List[int], 
         threading_module: 'ThreadingModule', 
         thread_count: int = 10,
-        progress_callback: Optional[Callable] = None
+        progress_callback: Optional[Callable] = None,
+        address: Optional[str] = None
     ) -> Dict[int, Dict[str, Any]]:
         """
         Step 9: Scan a list of ports on the target host using multithreading.
@@ -889,23 +1004,18 @@ class ScannerEngine:
             threading_module: ThreadingModule instance for managing threads
             thread_count: Number of threads to use for scanning
             progress_callback: Optional callback function to update progress
+            address: Pre-resolved IP of host, used for the connect tests so each
+                probe skips the DNS lookup; banner grabbing still uses host
             
         Returns:
             Dict[int, Dict[str, Any]]: Dictionary of open ports with service and banner information
         """
-        # Step 9.1: Import multiprocessing to get CPU count
-        import multiprocessing
-        import os
-        
-        # Step 9.2: Get the number of CPU cores available
-        # This helps determine optimal thread count
-        cpu_count = multiprocessing.cpu_count()
-        
-        # Step 9.3: Calculate optimal thread count based on CPU cores
-        # For I/O bound operations like network scanning, 2x CPU cores is optimal
-        max_recommended_threads = cpu_count * 2
+        # Step 9.1: Cap concurrency by the socket budget
+        # Probes are asynchronous connects (or greenlets under gevent), so
+        # what limits them is open file descriptors, not CPU cores
+        max_recommended_threads = threading_module.probe_limit
         
-        # Step 9.4: Cap the user-specified thread count to the optimal value
+        # Step 9.2: Cap the user-specified thread count to the optimal value
         # Too many threads can degrade performance
         if thread_count > max_recommended_threads:
             warning_msg = f"Requested {thread_count} threads exceeds the recommended maximum of {max_recommended_threads}"
@@ -916,27 +1026,36 @@ class ScannerEngine:
             if progress_callback:
                 progress_callback(0, f"WARNING: {warning_msg}. Using {max_recommended_threads} threads instead.")
         
-        # Step 9.5: The final thread count should not exceed the number of ports
+        # Step 9.3: The final thread count should not exceed the number of ports
         # No point in having more threads than tasks
         effective_thread_count = min(thread_count, len(ports))
         
-        logger.info(f"Using {effective_thread_count} threads on a system with {cpu_count} CPU cores")
+        logger.info(f"Using {effective_thread_count} concurrent probes on a system with {CPU_COUNT} CPU cores")
         
-        # Step 9.6: Shuffle ports to avoid sequential scanning patterns
+        # Step 9.4: Shuffle ports to avoid sequential scanning patterns
         # This makes the scan less detectable as an attack
         random.shuffle(ports)
         
-        # Step 9.7: Create scanning tasks
-        # Each task is a tuple of (function, arguments)
-        tasks = []
-        for port in ports:
-            tasks.append((self.scan_port_worker, (host, port, progress_callback)))
+        # Step 9.5: Sweep for open ports with at most effective_thread_count
+        # connection attempts in flight, then create one task per open port
+        # for service and banner detection (a tuple of (function, arguments))
+        if threading_module.cooperative:
+            # Greenlets already wait on sockets cooperatively, so the sweep
+            # runs on the (green) pool instead of an asyncio event loop
+            if address is None:
+                address = socket.gethostbyname(host)
+            probes = [(self._probe_port, (address, port, progress_callback)) for port in ports]
+            open_ports_found = threading_module.execute_tasks(probes, effective_thread_count) if probes else []
+        else:
+            open_ports_found = self.sweep_ports(host, ports, effective_thread_count,
+                                                progress_callback, threading_module.stop_event, address)
+        tasks = [(self.scan_port_worker, (host, port, progress_callback, True)) for port in open_ports_found]
         
-        # Step 9.8: Execute scans with threads
+        # Step 9.6: Execute scans with threads
         # This is where the ThreadingModule does the heavy lifting
-        results = threading_module.execute_tasks(tasks, effective_thread_count)
+        results = threading_module.execute_tasks(tasks, min(effective_thread_count, len(tasks))) if tasks else []
         
-        # Step 9.9: Collect results of open ports
+        # Step 9.7: Collect results of open ports
         open_ports = {}
         for port, is_open, service, banner_info in results:
             if is_open:
@@ -950,7 +1069,7 @@ class ScannerEngine:
                 }
                 open_ports[port] = port_data
                 
-        # Step 9.10: Return dictionary of open ports and their detailed information
+        # Step 9.8: Return dictionary of open ports and their detailed information
         return open_ports
         
     def ping_host(self, host: str) -> bool:
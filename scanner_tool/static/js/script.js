@@ -2,9 +2,29 @@
     let scanActive = false;
     let scanId = null;
     let updateInterval = null;
-    let resultCount = 0; // Track the number of found ports
+    let scanStream = null; // EventSource pushing progress for the active scan
+    let statusController = null; // AbortController of the in-flight status poll
+    let timedOutPolls = 0; // Consecutive status polls that hit their deadline
+    const renderedPorts = new Set(); // Ports already shown in the results table
     let currentLogIndex = 0;
 
+    // Formatters are costly to build, so create them once and reuse them
+    const TIME_FMT = new Intl.DateTimeFormat([], {hour: '2-digit', minute: '2-digit', second: '2-digit'});
+    const FULL_FMT = new Intl.DateTimeFormat([], {dateStyle: 'short', timeStyle: 'medium'});
+
+    // Log entry colour per level, applied through the --lvl custom property
+    const LOG_LEVEL_COLORS = {
+        info: 'var(--info-color)',
+        success: 'var(--success-color)',
+        warning: 'var(--warning-color)',
+        error: 'var(--secondary-color)'
+    };
+
+    // Log entries waiting for the next animation frame
+    const MAX_LOG_ENTRIES = 500;
+    const logQueue = [];
+    let logScheduled = false;
+
     // DOM Elements
     const targetInput = document.getElementById('target');
     const portRangeInput = document.getElementById('port-range');
@@ -25,7 +45,15 @@
     // Update current time
     function updateTime() {
         const now = new Date();
-        currentTimeElem.textContent = now.toLocaleString();
+        currentTimeElem.textContent = FULL_FMT.format(now);
+    }
+    
+    // Update the clock on each second boundary, skipping hidden tabs
+    function tickClock() {
+        if (!document.hidden) {
+            updateTime();
+        }
+        setTimeout(tickClock, 1000 - (Date.now() % 1000));
     }
     
     // Play sound effect (optional - silent if audio not supported)
@@ -36,15 +64,28 @@
 
     // Initialize
     document.addEventListener('DOMContentLoaded', function() {
-        updateTime();
-        setInterval(updateTime, 1000);
+        tickClock();
+
+        // Pause CSS animations while the tab is hidden; refresh the clock on return
+        document.addEventListener('visibilitychange', function() {
+            document.body.classList.toggle('tab-hidden', document.hidden);
+            if (!document.hidden) {
+                updateTime();
+            }
+        });
+
+        // Don't leave requests or streams running for a page that is going away
+        window.addEventListener('pagehide', function() {
+            abortStatusPoll();
+            closeScanStream();
+        });
 
         // Event listeners
         usePredefinedCheck.addEventListener('change', togglePortInput);
 
         // Check thread count on input to show warnings
-        threadsInput.addEventListener('input', function() {
-            const threadCount = parseInt(this.value);
+        threadsInput.addEventListener('input', debounce(function() {
+            const threadCount = parseInt(threadsInput.value);
             // Estimate CPU cores for client-side warning (actual value comes from server later)
             const estimatedCores = 8;
             const recommendedMax = estimatedCores * 2;
@@ -54,9 +95,18 @@
             } else {
                 threadWarning.style.display = 'none';
             }
-        });
+        }, 150));
     });
 
+    // Run fn only once input has been quiet for `wait` ms
+    function debounce(fn, wait) {
+        let timer = null;
+        return function(...args) {
+            clearTimeout(timer);
+            timer = setTimeout(() => fn.apply(this, args), wait);
+        };
+    }
+
     // Tab navigation
     function showTab(tabId) {
         // Hide all tab content
@@ -147,6 +197,7 @@
         exportButton.disabled = true;
         statusLabel.textContent = 'Scanning...';
         progressBar.style.width = '0%';
+        document.body.classList.add('scanning-mode');
 
         // Clear previous results
         clearResults(false);
@@ -180,9 +231,10 @@
 
             scanId = data.scan_id;
             scanActive = true;
+            currentLogIndex = 0;
 
-            // Start polling for updates
-            updateInterval = setInterval(updateScanProgress, 500);
+            // Subscribe to pushed progress updates
+            openScanStream();
         })
         .catch(error => {
             addLogEntry('Error starting scan: ' + error, 'error');
@@ -207,78 +259,161 @@
         });
 
         clearInterval(updateInterval);
+        abortStatusPoll();
+        closeScanStream();
         scanActive = false;
     }
 
-    // Update scan progress
+    // Receive scan progress as Server-Sent Events; falls back to polling
+    function openScanStream() {
+        if (!window.EventSource) {
+            updateInterval = setInterval(updateScanProgress, 500);
+            return;
+        }
+
+        scanStream = new EventSource(`/api/scan/${scanId}/stream?since=${currentLogIndex}`);
+        scanStream.onmessage = event => handleScanUpdate(JSON.parse(event.data));
+        scanStream.addEventListener('done', event => {
+            // Close first so the browser doesn't reconnect once the server ends the stream
+            closeScanStream();
+            handleScanUpdate(JSON.parse(event.data));
+        });
+        scanStream.onerror = () => {
+            // A browser reconnect would replay logs from the original cursor, so poll instead
+            closeScanStream();
+            if (scanActive) {
+                updateInterval = setInterval(updateScanProgress, 500);
+            }
+        };
+    }
+
+    function closeScanStream() {
+        if (scanStream) {
+            scanStream.close();
+            scanStream = null;
+        }
+    }
+
+    // Longest a single status poll may take before it is abandoned
+    const STATUS_POLL_TIMEOUT = 10000;
+
+    // Poll scan progress (used when the event stream is unavailable)
     function updateScanProgress() {
         if (!scanActive || !scanId) return;
 
-        fetch(`/api/scan/${scanId}/status`)
+        // Never let polls pile up: while one is still in flight, skip this
+        // tick instead of starting another, so a slow server or link sees
+        // fewer requests rather than a stream of cancelled ones. A poll that
+        // hangs is abandoned after STATUS_POLL_TIMEOUT; the log cursor only
+        // advances on success, so an abandoned poll loses nothing.
+        if (statusController) return;
+        const controller = statusController = new AbortController();
+        let timedOut = false;
+        const deadline = setTimeout(() => {
+            timedOut = true;
+            controller.abort();
+        }, STATUS_POLL_TIMEOUT);
+
+        fetch(`/api/scan/${scanId}/status?since=${currentLogIndex}`, {signal: controller.signal})
             .then(response => response.json())
             .then(data => {
-                // Show CPU cores information and thread limit if available
-                if (data.cpu_cores && !window.threadInfoShown) {
-                    const maxRecommended = data.max_recommended_threads || (data.cpu_cores * 2);
-                    addLogEntry(`System has ${data.cpu_cores} CPU cores. Maximum recommended threads: ${maxRecommended}`, 'info');
-
-                    // If user specified more threads than recommended, show a warning
-                    const userThreads = parseInt(threadsInput.value);
-                    if (userThreads > maxRecommended) {
-                        addLogEntry(`Your specified ${userThreads} threads exceeds the recommended maximum of ${maxRecommended}. The scan will use a limited thread count for optimal performance.`, 'warning');
+                timedOutPolls = 0;
+                handleScanUpdate(data);
+            })
+            .catch(error => {
+                if (error.name === 'AbortError') {
+                    // Aborted by stopping the scan: nothing to report
+                    if (!timedOut) return;
+                    timedOutPolls++;
+                    if (timedOutPolls % 3 === 0) {
+                        addLogEntry(`Scan status is slow to respond (${timedOutPolls} polls timed out), still retrying...`, 'warning');
                     }
-
-                    window.threadInfoShown = true;
+                    return;
                 }
+                addLogEntry('Error updating scan status: ' + error, 'error');
+                clearInterval(updateInterval);
+                resetScanUI();
+            })
+            .finally(() => {
+                clearTimeout(deadline);
+                if (statusController === controller) {
+                    statusController = null;
+                }
+            });
+    }
 
-                // Update progress bar
-                progressBar.style.width = `${data.progress}%`;
+    function abortStatusPoll() {
+        if (statusController) {
+            statusController.abort();
+            statusController = null;
+        }
+    }
 
-                // Add new log entries
-                if (data.logs && data.logs.length > 0) {
-                    data.logs.forEach(log => {
-                        addLogEntry(log.message, log.level);
-                    });
-                }
+    // Apply a status update from either the event stream or a poll
+    function handleScanUpdate(data) {
+        // Only logs after the cursor are returned; remember where to resume
+        if (typeof data.next === 'number') {
+            currentLogIndex = data.next;
+        }
 
-                // Update results table
-                if (data.results) {
-                    updateResultsTable(data.results);
-                }
-                
-                // Update dashboard statistics if we're on the same page
-                if (data.real_time_stats) {
-                    updateDashboardStats(data.real_time_stats);
-                }
+        // Show CPU cores information and thread limit if available
+        if (data.cpu_cores && !window.threadInfoShown) {
+            const maxRecommended = data.max_recommended_threads || (data.cpu_cores * 2);
+            addLogEntry(`System has ${data.cpu_cores} CPU cores. Maximum recommended threads: ${maxRecommended}`, 'info');
 
-                // Check if scan is complete
-                if (data.status === 'completed' || data.status === 'failed' || data.status === 'stopped') {
-                    clearInterval(updateInterval);
-                    scanActive = false;
-
-                    if (data.status === 'completed') {
-                        statusLabel.textContent = `Completed in ${data.duration.toFixed(2)}s`;
-                        progressBar.style.width = '100%';
-
-                        // Enable export button if we have results
-                        if (data.results && Object.keys(data.results).length > 0) {
-                            exportButton.disabled = false;
-                        }
-                    } else if (data.status === 'failed') {
-                        statusLabel.textContent = 'Scan Failed';
-                    } else {
-                        statusLabel.textContent = 'Stopped';
-                    }
+            // If user specified more threads than recommended, show a warning
+            const userThreads = parseInt(threadsInput.value);
+            if (userThreads > maxRecommended) {
+                addLogEntry(`Your specified ${userThreads} threads exceeds the recommended maximum of ${maxRecommended}. The scan will use a limited thread count for optimal performance.`, 'warning');
+            }
 
-                    scanButton.disabled = false;
-                    stopButton.disabled = true;
-                }
-            })
-            .catch(error => {
-                addLogEntry('Error updating scan status: ' + error, 'error');
-                clearInterval(updateInterval);
-                resetScanUI();
+            window.threadInfoShown = true;
+        }
+
+        // Update progress bar
+        progressBar.style.width = `${data.progress}%`;
+
+        // Add new log entries
+        if (data.logs && data.logs.length > 0) {
+            data.logs.forEach(log => {
+                addLogEntry(log.message, log.level);
             });
+        }
+
+        // Update results table
+        if (data.results) {
+            updateResultsTable(data.results);
+        }
+        
+        // Update dashboard statistics if we're on the same page
+        if (data.real_time_stats) {
+            updateDashboardStats(data.real_time_stats);
+        }
+
+        // Check if scan is complete
+        if (data.status === 'completed' || data.status === 'failed' || data.status === 'stopped') {
+            clearInterval(updateInterval);
+            closeScanStream();
+            scanActive = false;
+            document.body.classList.remove('scanning-mode');
+
+            if (data.status === 'completed') {
+                statusLabel.textContent = `Completed in ${data.duration.toFixed(2)}s`;
+                progressBar.style.width = '100%';
+
+                // Enable export button if we have results
+                if (data.results && Object.keys(data.results).length > 0) {
+                    exportButton.disabled = false;
+                }
+            } else if (data.status === 'failed') {
+                statusLabel.textContent = 'Scan Failed';
+            } else {
+                statusLabel.textContent = 'Stopped';
+            }
+
+            scanButton.disabled = false;
+            stopButton.disabled = true;
+        }
     }
 
     // Update dashboard statistics if we're on the dashboard page
@@ -296,101 +431,93 @@
         }
     }
 
-    // Update results table with banner grabbing information
-    function updateResultsTable(results) {
-        const host = targetInput.value.trim();
-        const currentPortCount = Object.keys(results).length;
-
-        // Only update if we have new results
-        if (currentPortCount > resultCount) {
-            const newPorts = currentPortCount - resultCount;
-            playTechSound('success');
-            addLogEntry(`Discovered ${newPorts} new open port${newPorts > 1 ? 's' : ''}`, 'success');
-
-            // Clear and rebuild the table for animation effect
-            resultsBody.innerHTML = '';
-
-            // Update with new result count
-            resultCount = currentPortCount;
+    // Build one results row by cloning the <template id="row-tpl"> markup
+    function buildRow(template, host, port, portData) {
+        // Parse port data to extract service, version, and server details
+        let service, version, server, banner, sslCert;
+
+        // Check if port data is enhanced format (object) or legacy format (string)
+        if (typeof portData === 'string') {
+            // Legacy format - just a service name string
+            service = portData;
+            version = '';
+            server = '';
+        } else {
+            // Enhanced format - object with detailed banner information
+            service = portData.service || '';
+            version = portData.version || '';
+            server = portData.server || '';
+            banner = portData.banner || '';
+            sslCert = portData.ssl_cert || {};
+        }
 
-            // Populate table with animation delay
-            let delay = 0;
-            for (const port in results) {
-                // Get full port data (either string or object with banner information)
-                const portData = results[port];
+        // textContent avoids HTML parsing per cell and keeps banners from injecting markup
+        const row = template.content.firstElementChild.cloneNode(true);
+        const cells = row.cells;
+        cells[0].textContent = host;
+        cells[1].textContent = port;
+        cells[3].textContent = service;
+        cells[4].textContent = version;
+        cells[5].textContent = server;
+
+        // Create details button for viewing banner information
+        const hasDetails = banner || (sslCert && Object.values(sslCert).some(v => v));
+        if (hasDetails) {
+            const detailsBtn = document.createElement('button');
+            detailsBtn.className = 'btn btn-sm btn-info';
+            detailsBtn.textContent = 'View';
+            detailsBtn.addEventListener('click', () => showDetailsModal(port, escape(JSON.stringify(portData))));
+            cells[6].appendChild(detailsBtn);
+        }
 
-                // Parse port data to extract service, version, and server details
-                let service, version, server, banner, sslCert;
+        // Add banner information to log view
+        if (banner) {
+            addLogEntry(`Port ${port} banner: ${banner}`, 'info');
+        }
 
-                // Check if port data is enhanced format (object) or legacy format (string)
-                if (typeof portData === 'string') {
-                    // Legacy format - just a service name string
-                    service = portData;
-                    version = '';
-                    server = '';
-                } else {
-                    // Enhanced format - object with detailed banner information
-                    service = portData.service || '';
-                    version = portData.version || '';
-                    server = portData.server || '';
-                    banner = portData.banner || '';
-                    sslCert = portData.ssl_cert || {};
-
-                    // Log banner data for debugging if needed
-                    console.log("Port data JSON:", encodeURIComponent(JSON.stringify(portData)));
-                    console.log("Parsed port data:", portData);
+        // Add SSL certificate information to log view if available
+        if (sslCert && Object.keys(sslCert).length > 0) {
+            let sslInfo = '';
+            for (const [key, value] of Object.entries(sslCert)) {
+                if (value) {
+                    const formattedKey = key.replace(/_/g, ' ').replace(/\b\w/g, l => l.toUpperCase());
+                    sslInfo += `${formattedKey}: ${value}, `;
                 }
+            }
 
-                // Create the table row with all available information
-                const row = document.createElement('tr');
-                row.style.animation = `fadeIn 0.3s ease ${delay}s both`;
-
-                // Build row with service and version information
-                // This also adds server information if available
-                // Create details button for viewing banner information
-                const hasDetails = banner || (sslCert && Object.values(sslCert).some(v => v));
-                const detailsBtn = hasDetails ? 
-                    `<button class="btn btn-sm btn-info" onclick="showDetailsModal(${port}, '${escape(JSON.stringify(portData))}')">View</button>` : 
-                    '';
-                
-                // Add status indicator with color coding
-                const statusIndicator = '<span class="status-indicator status-open"></span>';
-                
-                row.innerHTML = `
-                    <td>${host}</td>
-                    <td>${port}</td>
-                    <td class="port-open">${statusIndicator}Open</td>
-                    <td>${service}</td>
-                    <td>${version || ''}</td>
-                    <td>${server || ''}</td>
-                    <td>${detailsBtn}</td>
-                `;
-
-                // Add banner information to log view
-                if (banner) {
-                    addLogEntry(`Port ${port} banner: ${banner}`, 'info');
-                }
+            if (sslInfo) {
+                sslInfo = sslInfo.slice(0, -2); // Remove trailing comma and space
+                addLogEntry(`Port ${port} SSL Certificate: ${sslInfo}`, 'info');
+            }
+        }
 
-                // Add SSL certificate information to log view if available
-                if (sslCert && Object.keys(sslCert).length > 0) {
-                    let sslInfo = '';
-                    for (const [key, value] of Object.entries(sslCert)) {
-                        if (value) {
-                            const formattedKey = key.replace(/_/g, ' ').replace(/\b\w/g, l => l.toUpperCase());
-                            sslInfo += `${formattedKey}: ${value}, `;
-                        }
-                    }
+        return row;
+    }
 
-                    if (sslInfo) {
-                        sslInfo = sslInfo.slice(0, -2); // Remove trailing comma and space
-                        addLogEntry(`Port ${port} SSL Certificate: ${sslInfo}`, 'info');
-                    }
-                }
+    // Update results table with banner grabbing information
+    function updateResultsTable(results) {
+        // Nothing new since the last update
+        if (Object.keys(results).length === renderedPorts.size) {
+            return;
+        }
 
-                resultsBody.appendChild(row);
-                delay += 0.05;
+        // Build only the rows for newly discovered ports and append them in one go
+        const host = targetInput.value.trim();
+        const template = document.getElementById('row-tpl');
+        const fragment = document.createDocumentFragment();
+        for (const port in results) {
+            if (!renderedPorts.has(port)) {
+                renderedPorts.add(port);
+                fragment.appendChild(buildRow(template, host, port, results[port]));
             }
         }
+
+        const newPorts = fragment.childElementCount;
+        if (newPorts > 0) {
+            playTechSound('success');
+            addLogEntry(`Discovered ${newPorts} new open port${newPorts > 1 ? 's' : ''}`, 'success');
+            resultsBody.appendChild(fragment);
+        }
     }
 
     // Show details modal for SSL and banner information
@@ -499,14 +626,35 @@
         modal.classList.remove('show');
     }
 
-    // Add log entry
+    // Add log entry; entries are queued and written once per animation frame
     function addLogEntry(message, level) {
-        const timestamp = new Date().toLocaleTimeString();
-        const logEntry = document.createElement('div');
-        logEntry.className = `log-entry log-${level}`;
-        logEntry.textContent = `[${timestamp}] ${message}`;
+        logQueue.push({message, level, timestamp: TIME_FMT.format(new Date())});
+        if (!logScheduled) {
+            logScheduled = true;
+            requestAnimationFrame(flushLogs);
+        }
+    }
+
+    // Append all queued log entries with a single layout and scroll
+    function flushLogs() {
+        logScheduled = false;
+        const fragment = document.createDocumentFragment();
+        for (const {message, level, timestamp} of logQueue) {
+            const logEntry = document.createElement('div');
+            logEntry.className = 'log-entry';
+            if (level in LOG_LEVEL_COLORS) {
+                logEntry.style.setProperty('--lvl', LOG_LEVEL_COLORS[level]);
+            }
+            logEntry.textContent = `[${timestamp}] ${message}`;
+            fragment.appendChild(logEntry);
+        }
+        logQueue.length = 0;
 
-        logContainer.appendChild(logEntry);
+        logContainer.appendChild(fragment);
+        // Keep the log bounded on long scans
+        while (logContainer.childElementCount > MAX_LOG_ENTRIES) {
+            logContainer.firstElementChild.remove();
+        }
         logContainer.scrollTop = logContainer.scrollHeight; // Auto-scroll to bottom
     }
 
@@ -516,12 +664,16 @@
         stopButton.disabled = true;
         scanActive = false;
         clearInterval(updateInterval);
+        abortStatusPoll();
+        closeScanStream();
+        document.body.classList.remove('scanning-mode');
     }
 
     // Clear results
     function clearResults(clearLogs = true) {
         // Clear table
         resultsBody.innerHTML = '';
+        renderedPorts.clear();
 
         // Reset progress
         progressBar.style.width = '0%';
@@ -532,6 +684,7 @@
         // Clear logs if requested
         if (clearLogs) {
             logContainer.innerHTML = '';
+            logQueue.length = 0;
             addLogEntry('Results and logs cleared', 'info');
         }
 
@@ -546,6 +699,7 @@
             return;
         }
 
+        setExportStatus('');
         exportModal.style.display = 'block';
         // Add a small delay to ensure display is set before adding show class
         setTimeout(() => {
@@ -556,16 +710,79 @@
     // Close export modal
     function closeExportModal() {
         exportModal.classList.remove('show');
-        // Wait for transition to complete before hiding
-        setTimeout(() => {
-            exportModal.style.display = 'none';
-        }, 300);
+        // Hide once the browser reports the fade-out finished
+        exportModal.addEventListener('transitionend', function hide(event) {
+            // Transitions of the modal's content bubble up here too
+            if (event.target !== exportModal) return;
+            exportModal.removeEventListener('transitionend', hide);
+            // Reopened meanwhile
+            if (!exportModal.classList.contains('show')) {
+                exportModal.style.display = 'none';
+            }
+        });
+    }
+
+    // Show a progress or error message in the export modal ('' hides it)
+    function setExportStatus(message) {
+        const exportStatus = document.getElementById('export-status');
+        exportStatus.textContent = message;
+        exportStatus.hidden = !message;
+    }
+
+    // Enable or disable the format buttons while an export is in progress
+    function setExportButtonsDisabled(disabled) {
+        exportModal.querySelectorAll('.export-btn').forEach(button => {
+            button.disabled = disabled;
+        });
+    }
+
+    // How often and for how long a background export job is polled
+    const EXPORT_POLL_INTERVAL = 500;
+    const EXPORT_TIMEOUT = 5 * 60 * 1000;
+
+    // Poll a background export job until its file is ready, then fetch it
+    function waitForExport(statusUrl, deadline = Date.now() + EXPORT_TIMEOUT) {
+        return fetch(statusUrl)
+            .then(response => {
+                // 404: the job expired, belongs to someone else, or lives on another worker
+                if (response.status === 404) {
+                    throw new Error('Export job not found. It may have expired; please export again.');
+                }
+                if (!response.ok) {
+                    throw new Error(`Export status check failed (HTTP ${response.status})`);
+                }
+                return response.json();
+            })
+            .then(job => {
+                if (!job.done) {
+                    if (Date.now() >= deadline) {
+                        throw new Error('Export is taking too long. Please try again later.');
+                    }
+                    return new Promise(resolve => setTimeout(resolve, EXPORT_POLL_INTERVAL))
+                        .then(() => waitForExport(statusUrl, deadline));
+                }
+                if (!job.download_url) {
+                    throw new Error(job.error || 'Export failed');
+                }
+                return fetch(job.download_url).then(response => {
+                    if (response.ok) {
+                        return response.blob();
+                    }
+                    throw new Error('Export failed');
+                });
+            });
     }
 
     // Export results
     function exportResults(format) {
+        setExportButtonsDisabled(true);
+        setExportStatus('Exporting...');
         fetch(`/api/export/${format}?scan_id=${scanId}`)
             .then(response => {
+                // Excel and PDF exports are built in the background
+                if (response.status === 202) {
+                    return response.json().then(job => waitForExport(job.status_url));
+                }
                 if (response.ok) {
                     return response.blob();
                 }
@@ -575,7 +792,8 @@
                 // Create file name
                 const timestamp = new Date().toISOString().replace(/[:.]/g, '-');
                 const host = targetInput.value.trim();
-                const fileName = `${host}_scan_${timestamp}.${format}`;
+                const extension = format === 'excel' ? 'xlsx' : format;
+                const fileName = `${host}_scan_${timestamp}.${extension}`;
 
                 // Create download link
                 const url = window.URL.createObjectURL(blob);
@@ -590,12 +808,14 @@
                 document.body.removeChild(a);
 
                 addLogEntry(`Results exported to ${format.toUpperCase()}`, 'success');
+                setExportStatus('');
                 closeExportModal();
             })
             .catch(error => {
-                addLogEntry(`Export error: ${error}`, 'error');
-                alert(`Export failed: ${error}`);
-            });
+                addLogEntry(`Export error: ${error.message}`, 'error');
+                setExportStatus(`Export failed: ${error.message}`);
+            })
+            .finally(() => setExportButtonsDisabled(false));
     }
 
     // Close modal when clicking outside of it
@@ -13,6 +13,30 @@ from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+def _threads_are_green() -> bool:
+    """Return True when gevent has monkey-patched threading (see main.py)."""
+    try:
+        from gevent import monkey
+    except ImportError:
+        return False
+    return monkey.is_module_patched('threading')
+
+def _socket_budget() -> int:
+    """
+    Number of concurrent connections a cooperative scan may hold open.
+    
+    Returns:
+        int: Half of the soft open-file limit, kept between 100 and 1024
+    """
+    try:
+        import resource
+        soft_limit, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    except (ImportError, ValueError, OSError):
+        return 100
+    if soft_limit == resource.RLIM_INFINITY:
+        return 1024
+    return max(100, min(1024, soft_limit // 2))
+
 class ThreadingModule:
     """
     Manages thread creation and synchronization for efficient port scanning.
@@ -25,6 +49,14 @@ class ThreadingModule:
         # Set reasonable limits for thread count based on system capabilities
         cpu_count = os.cpu_count() or 4  # Default to 4 if cpu_count returns None
         self.MAX_THREAD_COUNT = min(100, cpu_count * 5)
+        # Under gevent each worker "thread" is a greenlet, so concurrency is
+        # bounded by how many sockets we can hold open, not by CPU count
+        self.cooperative = _threads_are_green()
+        # Port probes are asynchronous connects (greenlets under gevent), so
+        # how many may be in flight is bounded by open files, not threads
+        self.probe_limit = _socket_budget()
+        if self.cooperative:
+            self.MAX_THREAD_COUNT = self.probe_limit
         
     def execute_tasks(self, tasks: List[Tuple[Callable, Tuple]], thread_count: int) -> List[Any]:
         """